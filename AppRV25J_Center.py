@@ -17,7 +17,7 @@ except ImportError:
 # --- Custom Component Imports ---
 # Ensure ImageSelect.py and Toml_Verify_Edit.py are in the same directory
 from ImageSelect import ImageSelect 
-from Toml_Verify_Edit import OCRTomlEditor 
+from Toml_Verify_Edit import OCRTomlEditor, _strip_rv25j
 
 # --- Configuration Constants ---
 WINDOW_TITLE = "RV25J OCR Center"
@@ -305,9 +305,7 @@ class RV25J_OCR_Center(tk.Tk):
         self.log_activity(f"Selected: {path_obj.name}")
 
         # 1. Determine Base Name (remove _RV25J suffix)
-        base_name_str = path_obj.stem
-        if base_name_str.lower().endswith('_rv25j'):
-            base_name_str = base_name_str[:-6]
+        base_name_str = _strip_rv25j(path_obj.stem)
 
         # 2. Load Image
         if self.image_selector:
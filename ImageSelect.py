@@ -5,6 +5,7 @@ from pathlib import Path  # Use pathlib for modern path handling
 import json
 import time
 import os # Keep os for compatibility with Tkinter widgets if needed
+from Toml_Verify_Edit import _strip_rv25j
 
 class ImageSelect(ttk.Frame):
     """
@@ -85,16 +86,11 @@ class ImageSelect(ttk.Frame):
         if not self.image_path:
             return None
         
-        # Check if the filename ends with the marker (case-insensitive)
-        name_lower = self.image_path.name.lower()
-        marker = "_rv25j.jpg"
-        
-        if name_lower.endswith(marker):
-            # Extract the part before the marker and extension
-            base_stem = self.image_path.stem[:-6] # stem is 'scan_001_RV25J', remove '_RV25J' (6 chars)
-        else:
-            # Fallback to the original stem if the marker is not found
-            base_stem = self.image_path.stem 
+        # Strip the _RV25J marker (case-insensitive) from *_RV25J.jpg names;
+        # fallback to the original stem for any other file
+        base_stem = self.image_path.stem
+        if self.image_path.suffix.lower() == '.jpg':
+            base_stem = _strip_rv25j(base_stem)
             
         return base_stem
 
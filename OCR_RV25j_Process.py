@@ -17,12 +17,9 @@ Pipeline:
 import argparse
 import re
 from pathlib import Path
-from io import StringIO
+from io import BytesIO
 
 import pandas as pd
-from bs4 import BeautifulSoup
-from paddleocr import PPStructureV3
-import matplotlib.pyplot as plt
 import numpy as np
 
 # ---- TOML reader (Python 3.11+ or older with tomli) -----------------
@@ -53,9 +50,13 @@ def safe_float(s):
 
 
 class RV25jProcessor:
-    def __init__(self, root_folder: str, skip_ocr: bool = False):
+    # single-pass escaping for TOML basic strings (backslash, double quote)
+    _TOML_ESC = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+    def __init__(self, root_folder: str, skip_ocr: bool = False, force: bool = False):
         self.root = Path(root_folder)
         self.skip_ocr = skip_ocr
+        self.force = force
         self.pipeline = None
         self.config = {}
         self.COLUMN_SPEC = None
@@ -74,6 +75,9 @@ class RV25jProcessor:
         except Exception as e:
             raise SystemExit(f"[FATAL] Failed to read/parse config.toml → {e}")
 
+        # *_OCR.toml older than config.toml is stale (META/Deed are copied into it)
+        self._cfg_mtime = cfg_path.stat().st_mtime_ns
+
         # NEW: Load COLUMN_SPEC from config
         try:
             # Assuming COLUMN_SPEC is something like ['MARKER', 'NORTHING', 'EASTING']
@@ -81,8 +85,15 @@ class RV25jProcessor:
         except KeyError:
             raise SystemExit("[FATAL] config.toml missing key: [META].COLUMN_SPEC")
 
-        # Init OCR pipeline (if needed)
-        if not self.skip_ocr:
+    def _get_pipeline(self):
+        """
+        OCR pipeline, created the first time an image actually needs OCR.
+        paddleocr is imported here too: pulling in paddlepaddle and loading the
+        models costs seconds, wasted on parse-only or all-up-to-date runs.
+        """
+        if self.pipeline is None:
+            from paddleocr import PPStructureV3
+
             print("[INFO] Init PaddleOCR Thai PP-StructureV3...")
             self.pipeline = PPStructureV3(
                 lang="th",
@@ -91,6 +102,7 @@ class RV25jProcessor:
                 use_textline_orientation=False,
                 use_table_recognition=True,
             )
+        return self.pipeline
 
     # -----------------------------------------------------------
     def get_prefix(self, image_path: Path) -> str:
@@ -130,16 +142,20 @@ class RV25jProcessor:
     # -----------------------------------------------------------
     def parse_markdown_table(self, md_path: Path) -> pd.DataFrame:
         MRK_COL,N_COL,E_COL = self.COLUMN_SPEC 
-        html = md_path.read_text(encoding="utf-8", errors="ignore").strip()
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table")
+        # Slice out the first <table>...</table> only; no need to build a DOM
+        # for the surrounding markdown/HTML that is thrown away anyway
+        data = md_path.read_bytes()
+        i = data.find(b"<table")
+        j = data.find(b"</table>", i) if i >= 0 else -1
 
-        if not table:
+        if i < 0 or j < 0:
             print(f"[WARN] No <table> in {md_path}")
             return pd.DataFrame(columns=[c for c in self.COLUMN_SPEC if c])
 
         try:
-            df_raw = pd.read_html(StringIO(str(table)))[0].reset_index(drop=True)
+            df_raw = pd.read_html(
+                BytesIO(data[i:j + len(b"</table>")]), encoding="utf-8"
+            )[0].reset_index(drop=True)
         except Exception as e:
             print(f"[WARN] pandas.read_html failed {md_path}: {e}")
             return pd.DataFrame(columns=[c for c in self.COLUMN_SPEC if c])
@@ -287,6 +303,16 @@ class RV25jProcessor:
             print(f"[{idx}] {display_path}")
         print("-" * 60)
 
+    # -----------------------------------------------------------
+    def is_up_to_date(self, image_path: Path) -> bool:
+        """True if *_OCR.toml is newer than both the image and config.toml."""
+        out = image_path.with_name(f"{self.get_prefix(image_path)}_OCR.toml")
+        try:
+            out_mtime = out.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        return out_mtime >= max(image_path.stat().st_mtime_ns, self._cfg_mtime)
+
     # -----------------------------------------------------------
     def run_ocr(self, image_path: Path) -> pd.DataFrame:
         prefix = self.get_prefix(image_path)
@@ -294,7 +320,7 @@ class RV25jProcessor:
         out_img_dir.mkdir(exist_ok=True)
 
         print(f"\n[INFO] OCR: {image_path}")
-        outputs = self.pipeline.predict(str(image_path))
+        outputs = self._get_pipeline().predict(str(image_path))
 
         dfs = []
         for i, res in enumerate(outputs):
@@ -331,7 +357,7 @@ class RV25jProcessor:
 
     # -----------------------------------------------------------
     def _toml_escape(self, s: str) -> str:
-        return s.replace("\\", "\\\\").replace('"', '\\"')
+        return s.translate(self._TOML_ESC)
 
     # -----------------------------------------------------------
     def get_meta_and_deed_from_config(self):
@@ -436,6 +462,11 @@ class RV25jProcessor:
             print("\n" + "=" * 70)
             print(f"[PROCESS] {img}")
 
+            # Incremental: OCR is by far the slowest step, skip unchanged images
+            if not self.skip_ocr and not self.force and self.is_up_to_date(img):
+                print("[SKIP] *_OCR.toml is up to date (use -f/--force to redo)")
+                continue
+
             df = self.parse_existing_md(img) if self.skip_ocr else self.run_ocr(img)
 
             if df.empty:
@@ -463,6 +494,11 @@ def main():
         action="store_true",
         help="List all matching files with ID numbers and exit."
     )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Re-run OCR even if *_OCR.toml is newer than the image and config.toml."
+    )
     # ADDED: Images range argument
     parser.add_argument(
         "-i", "--images",
@@ -473,7 +509,9 @@ def main():
     args = parser.parse_args()
     
     # Force skip_ocr if we are only listing files
-    processor = RV25jProcessor(args.folder, skip_ocr=(args.skip_ocr or args.list))
+    processor = RV25jProcessor(
+        args.folder, skip_ocr=(args.skip_ocr or args.list), force=args.force
+    )
     
     if args.list:
         processor.list_files()
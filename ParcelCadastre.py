@@ -24,15 +24,26 @@ Assumptions
 """
 
 import argparse
+import functools
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Point, LineString, Polygon
+import shapely
 from pyproj import CRS, Transformer
 
+# --- GPKG write engine: pyogrio is ~3x faster than Fiona for GPKG ---
+try:
+    import pyogrio  # noqa: F401
+    GPKG_ENGINE = "pyogrio"
+except ImportError:
+    GPKG_ENGINE = "fiona"  # fallback for older geopandas installs
+
 # --- TOML loader ---
 try:
     import tomllib  # Python 3.11+
@@ -40,6 +51,28 @@ except ImportError:
     import tomli as tomllib  # fallback for older versions
 
 
+_EMPTY: dict = {}
+
+# Per-file layers hold a handful of features; building an R-tree for each
+# one costs more than it ever saves, so skip it.
+GPKG_LAYER_OPTIONS = {"SPATIAL_INDEX": "NO"}
+
+# Source EPSG (Indian 1975 / WGS84 UTM) -> WGS84 UTM output EPSG
+_EPSG_MAP = {24047: 32647, 24048: 32648, 32647: 32647, 32648: 32648}
+
+# Used by MarkerLoader.migrate_legacy_toml to rewrite legacy [deed]/epsg/crs keys
+# Any table or array-of-tables header: [a], [a.b], [[a.b]], ["quoted".b] ...
+# (a dotted key, so multi-line array rows such as [1, "A", ...] never match)
+_TOML_KEY_PART = r"""(?:[\w\-]+|"[^"]*"|'[^']*')"""
+_SECTION_HEADER = re.compile(
+    rf"^\s*(\[\[?)\s*({_TOML_KEY_PART}(?:\s*\.\s*{_TOML_KEY_PART})*)\s*\]\]?\s*(?:#.*)?$"
+)
+_LEGACY_EPSG_KEY = re.compile(r"^(\s*)(EPSG|epsg|crs|CRS)(?=\s*=)")
+_LEGACY_EPSG_NAMES = ("epsg", "crs", "CRS")
+# Value of a legacy key that can be promoted: 24047, "24047" or "EPSG:24047"
+_LEGACY_EPSG_VALUE = re.compile(r"""\s*=\s*(["']?)(?:EPSG:)?(\d+)\1(\s*#.*)?\s*$""", re.IGNORECASE)
+
+
 # =========================================
 # Config class
 # =========================================
@@ -91,10 +124,60 @@ class RV25JConfig:
         )
 
 
+def _fast_mode_int(series: pd.Series) -> int:
+    """Most frequent integer in series (smallest on ties, like Series.mode()[0])."""
+    vals, counts = np.unique(series.to_numpy(), return_counts=True)
+    return int(vals[counts.argmax()])
+
+
 # =========================================
 # CRS / Transformer factory (No changes)
 # =========================================
 # ... (CRSFactory class remains unchanged)
+@functools.lru_cache(maxsize=256)
+def _crs_from_epsg(code: int) -> CRS:
+    """CRS.from_epsg memoized by integer code (CRS construction hits the PROJ db)."""
+    return CRS.from_epsg(code)
+
+
+def _build_proj4_id75(epsg: int, towgs84: Tuple[float, ...] | None) -> CRS:
+    """
+    For EPSG 24047/24048, build Indian 1975 / UTM zone 47 or 48
+    with ellipsoid + towgs84. Otherwise use EPSG directly (e.g. 32647).
+    """
+    if epsg == 24047:
+        zone = 47
+    elif epsg == 24048:
+        zone = 48
+    else:
+        # Non-Indian 1975: use EPSG directly (e.g. 32647)
+        return _crs_from_epsg(epsg)
+
+    towgs_str = ""
+    if towgs84:
+        towgs_str = "+towgs84=" + ",".join(str(v) for v in towgs84) + " "
+
+    proj4 = (
+        f"+proj=utm +zone={zone} "
+        f"+a=6377276.345 +rf=300.8017 "
+        f"{towgs_str}"
+        f"+units=m +no_defs"
+    )
+    return CRS.from_proj4(proj4)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_transformer(
+    src_epsg: int, dst_epsg: int, towgs84: Tuple[float, ...] | None = None
+) -> Transformer:
+    """
+    Transformer keyed by integer EPSG codes (plus the towgs84 tuple used for
+    Indian 1975), so repeated EPSG pairs never rebuild PROJ objects.
+    """
+    crs_src = _build_proj4_id75(src_epsg, towgs84)
+    return Transformer.from_crs(crs_src, _crs_from_epsg(dst_epsg), always_xy=True)
+
+
 class CRSFactory:
     """
     Build CRS for Indian 1975 UTM (EPSG 24047 / 24048) with towgs84 if provided,
@@ -103,52 +186,21 @@ class CRSFactory:
 
     def __init__(self, towgs84: List[float] | None):
         self.towgs84 = towgs84
-        self._crs_cache: Dict[int, CRS] = {}
-        self._transformer_cache: Dict[int, Transformer] = {}
-        self._crs_wgs84 = CRS.from_epsg(4326)
-
-        # cache for WGS84 UTM (output) CRSs and transformers
-        self._crs_w84_utm_cache: Dict[int, CRS] = {}
-        self._transformer_w84_utm_cache: Dict[int, Transformer] = {}
-
-    def _build_proj4_id75(self, epsg: int) -> CRS:
-        """
-        For EPSG 24047/24048, build Indian 1975 / UTM zone 47 or 48
-        with ellipsoid + towgs84. Otherwise use EPSG directly (e.g. 32647).
-        """
-        if epsg == 24047:
-            zone = 47
-        elif epsg == 24048:
-            zone = 48
-        else:
-            # Non-Indian 1975: use EPSG directly (e.g. 32647)
-            return CRS.from_epsg(epsg)
-
-        towgs_str = ""
-        if self.towgs84 and len(self.towgs84) >= 3:
-            towgs_str = "+towgs84=" + ",".join(str(v) for v in self.towgs84) + " "
-
-        proj4 = (
-            f"+proj=utm +zone={zone} "
-            f"+a=6377276.345 +rf=300.8017 "
-            f"{towgs_str}"
-            f"+units=m +no_defs"
+        # hashable form of towgs84 for the module-level caches
+        self._towgs84_key = (
+            tuple(float(v) for v in towgs84) if towgs84 and len(towgs84) >= 3 else None
         )
-        return CRS.from_proj4(proj4)
+        self._crs_cache: Dict[int, CRS] = {}
+        self._crs_wgs84 = _crs_from_epsg(4326)
 
     def get_src_crs(self, epsg: int) -> CRS:
         """Return CRS for given EPSG (ID75 w/ towgs84 or normal EPSG)."""
         if epsg not in self._crs_cache:
-            self._crs_cache[epsg] = self._build_proj4_id75(epsg)
+            self._crs_cache[epsg] = _build_proj4_id75(epsg, self._towgs84_key)
         return self._crs_cache[epsg]
 
     def get_transformer_to_wgs84(self, epsg: int) -> Transformer:
-        if epsg not in self._transformer_cache:
-            crs_src = self.get_src_crs(epsg)
-            self._transformer_cache[epsg] = Transformer.from_crs(
-                crs_src, self._crs_wgs84, always_xy=True
-            )
-        return self._transformer_cache[epsg]
+        return _cached_transformer(epsg, 4326, self._towgs84_key)
 
     def get_w84_utm_crs(self, epsg_src: int) -> CRS:
         """
@@ -157,31 +209,14 @@ class CRSFactory:
         24048,32648 -> EPSG:32648
         others     -> keep same EPSG as fallback.
         """
-        if epsg_src in self._crs_w84_utm_cache:
-            return self._crs_w84_utm_cache[epsg_src]
-
-        if epsg_src in (24047, 32647):
-            epsg_dst = 32647
-        elif epsg_src in (24048, 32648):
-            epsg_dst = 32648
-        else:
-            epsg_dst = epsg_src
-
-        crs = CRS.from_epsg(epsg_dst)
-        self._crs_w84_utm_cache[epsg_src] = crs
-        return crs
+        return _crs_from_epsg(_EPSG_MAP.get(epsg_src, epsg_src))
 
     def get_transformer_to_w84_utm(self, epsg_src: int) -> Transformer:
         """
         Transformer from source CRS (ID75 / existing EPSG) to WGS84 UTM.
         """
-        if epsg_src not in self._transformer_w84_utm_cache:
-            crs_src = self.get_src_crs(epsg_src)
-            crs_dst = self.get_w84_utm_crs(epsg_src)
-            self._transformer_w84_utm_cache[epsg_src] = Transformer.from_crs(
-                crs_src, crs_dst, always_xy=True
-            )
-        return self._transformer_w84_utm_cache[epsg_src]
+        epsg_dst = _EPSG_MAP.get(epsg_src, epsg_src)
+        return _cached_transformer(epsg_src, epsg_dst, self._towgs84_key)
 
     @property
     def crs_wgs84(self) -> CRS:
@@ -214,23 +249,68 @@ class MarkerLoader:
         return stem
 
     @staticmethod
-    def _extract_epsg_from_toml(toml_data: dict, default_epsg: int) -> int:
-        """Look for EPSG or crs inside [Deed] section."""
-        deed = toml_data.get("Deed") or toml_data.get("deed")
-        if not isinstance(deed, dict):
-            return default_epsg
+    def _extract_epsg_from_toml(toml_data: dict, default_epsg: int, source: Optional[Path] = None) -> int:
+        """
+        Read [Deed].EPSG (canonical casing, see migrate_legacy_toml).
+        Accepts an integer, an integral float or a digit string; anything else
+        (bool, 24048.9, "EPSG:24047", a non-table [Deed]) falls back to default_epsg.
+        """
+        deed = toml_data.get("Deed", _EMPTY)
+        epsg = deed.get("EPSG", default_epsg) if isinstance(deed, dict) else None
+        if isinstance(epsg, bool):
+            pass
+        elif isinstance(epsg, int):
+            return epsg
+        elif isinstance(epsg, float) and epsg.is_integer():
+            return int(epsg)
+        elif isinstance(epsg, str) and epsg.strip().isdigit():
+            return int(epsg)
+        what = f"[Deed].EPSG {epsg!r}" if isinstance(deed, dict) else "[Deed] (not a table)"
+        where = f" in {source}" if source is not None else ""
+        print(f"[WARN] invalid {what}{where}; using default EPSG {default_epsg}")
+        return default_epsg
 
-        epsg = deed.get("EPSG") or deed.get("epsg")
-        if epsg is None:
-            crs_val = deed.get("crs") or deed.get("CRS")
-            if crs_val is not None:
-                try:
-                    epsg = int(crs_val)
-                except ValueError:
-                    epsg = None
-        if epsg is None:
-            return default_epsg
-        return int(epsg)
+    @staticmethod
+    def migrate_legacy_toml(path: Path) -> bool:
+        """
+        Rewrite a legacy TOML in place to the canonical [Deed].EPSG layout:
+          [deed], [deed.x]  -> [Deed], [Deed.x]
+          epsg / crs / CRS  -> EPSG   (directly under [Deed] only, not [deed.x] subtables)
+        A legacy key is promoted only if its value is an integer, "NNNN" or
+        "EPSG:NNNN" (written back as NNNN); anything else is left as it is.
+        Returns True if the file was changed.
+        """
+        text = path.read_text(encoding="utf-8")
+        lines = text.splitlines()
+        changed = False
+        in_deed = False
+        legacy, canonical = [], False
+        for n, line in enumerate(lines):
+            header = _SECTION_HEADER.match(line)
+            if header:
+                is_table = header.group(1) == "["
+                name = header.group(2)
+                if name.split(".", 1)[0].strip() == "deed":
+                    lines[n] = line.replace("deed", "Deed", 1)
+                    changed = True
+                in_deed = is_table and name in ("Deed", "deed")
+            elif in_deed:
+                m = _LEGACY_EPSG_KEY.match(line)
+                if m and m.group(2) == "EPSG":
+                    canonical = True
+                elif m:
+                    value = _LEGACY_EPSG_VALUE.match(line, m.end(2))
+                    if value:
+                        legacy.append((n, m, value))
+        # keep an existing EPSG; otherwise promote the first usable legacy key
+        if legacy and not canonical:
+            n, m, value = legacy[0]
+            lines[n] = f"{m.group(1)}EPSG = {int(value.group(2))}{value.group(3) or ''}"
+            changed = True
+        if changed:
+            tail = "\n" if text.endswith("\n") else ""
+            path.write_text("\n".join(lines) + tail, encoding="utf-8")
+        return changed
 
     @staticmethod
     def _extract_markers_from_deed(toml_data: dict, toml_spec: List[str]):
@@ -241,12 +321,9 @@ class MarkerLoader:
         """
         rows = []
 
-        deed = toml_data.get("Deed") or toml_data.get("deed")
-        if not isinstance(deed, dict):
-            return rows
-
-        marker_arr = deed.get("marker")
-        if not isinstance(marker_arr, list):
+        try:
+            marker_arr = toml_data["Deed"]["marker"]
+        except (KeyError, TypeError):
             return rows
 
         # Check if TOML_SPEC has the expected 5 elements
@@ -289,8 +366,8 @@ class MarkerLoader:
         if not self.folder.is_dir():
             raise NotADirectoryError(f"Folder not found: {self.folder}")
 
-        # Recursive search for *_OCRedit.toml
-        toml_files = list(self.folder.rglob("*_OCRedit.toml"))
+        # Recursive search for *_OCRedit.toml (sorted: fixes row and GPKG layer order)
+        toml_files = sorted(self.folder.rglob("*_OCRedit.toml"))
 
         if not toml_files:
             raise FileNotFoundError(
@@ -310,7 +387,17 @@ class MarkerLoader:
                 print(f"[ERROR] reading {chosen}: {e}")
                 continue
 
-            epsg = self._extract_epsg_from_toml(data, self.config.default_epsg)
+            if "deed" in data and "Deed" not in data:
+                print(f"[WARN] legacy [deed] layout in {chosen}; run with --migrate (file skipped)")
+                continue
+            deed = data.get("Deed")
+            if (isinstance(deed, dict) and "EPSG" not in deed
+                    and any(k in deed for k in _LEGACY_EPSG_NAMES)):
+                # Falling back to default_epsg here could put markers in the wrong zone
+                print(f"[WARN] legacy epsg/crs key under [Deed] in {chosen}; run with --migrate (file skipped)")
+                continue
+
+            epsg = self._extract_epsg_from_toml(data, self.config.default_epsg, chosen)
             marker_rows = self._extract_markers_from_deed(data, toml_spec) # Pass TOML_SPEC
 
             if not marker_rows:
@@ -351,54 +438,53 @@ class CoordinateTransformer:
         self.col_easting = "EASTING"
 
 
+    def _transform_by_epsg(self, df_id75: pd.DataFrame, get_transformer):
+        """
+        Transform EASTING/NORTHING with one PROJ call per EPSG group.
+        Returns (x, y) float64 arrays aligned with df_id75 rows.
+        """
+        e_all = df_id75[self.col_easting].to_numpy(dtype=np.float64)
+        n_all = df_id75[self.col_northing].to_numpy(dtype=np.float64)
+        xs = np.empty_like(e_all)
+        ys = np.empty_like(n_all)
+
+        for epsg, idx in df_id75.groupby("EPSG", sort=False, observed=True).indices.items():
+            transformer = get_transformer(int(epsg))
+            e_arr = np.ascontiguousarray(e_all[idx])
+            n_arr = np.ascontiguousarray(n_all[idx])
+            xs[idx], ys[idx] = transformer.transform(e_arr, n_arr)
+        return xs, ys
+
     def to_wgs84(self, df_id75: pd.DataFrame) -> pd.DataFrame:
         """Indian 1975 (or other EPSG) → geographic WGS84 (EPSG:4326)."""
-        lons = []
-        lats = []
-        for e, n, epsg in zip(
-            df_id75[self.col_easting], df_id75[self.col_northing], df_id75["EPSG"]
-        ):
-            transformer = self.crs_factory.get_transformer_to_wgs84(int(epsg))
-            lon, lat = transformer.transform(e, n)
-            lons.append(lon)
-            lats.append(lat)
-
-        df_LL_W84 = df_id75.copy()
-        df_LL_W84["LON"] = lons
-        df_LL_W84["LAT"] = lats
+        lons, lats = self._transform_by_epsg(
+            df_id75, self.crs_factory.get_transformer_to_wgs84
+        )
+        df_LL_W84 = pd.DataFrame(
+            {**{c: df_id75[c].to_numpy() for c in df_id75.columns},
+             "LON": lons, "LAT": lats},
+            index=df_id75.index,
+        )
         return df_LL_W84
 
     def to_w84_utm(self, df_id75: pd.DataFrame) -> pd.DataFrame:
         """
         Indian 1975 UTM (24047/24048) → WGS84 UTM (32647/32648).
         """
-        xs = []
-        ys = []
-        epsg_out = []
-
-        for e, n, epsg in zip(
-            df_id75[self.col_easting], df_id75[self.col_northing], df_id75["EPSG"]
-        ):
-            epsg_src = int(epsg)
-            transformer = self.crs_factory.get_transformer_to_w84_utm(epsg_src)
-            x, y = transformer.transform(e, n)
-
-            if epsg_src in (24047, 32647):
-                epsg_dst = 32647
-            elif epsg_src in (24048, 32648):
-                epsg_dst = 32648
-            else:
-                epsg_dst = epsg_src  # fallback
-
-            xs.append(x)
-            ys.append(y)
-            epsg_out.append(epsg_dst)
-
-        df_W84 = df_id75.copy()
+        xs, ys = self._transform_by_epsg(
+            df_id75, self.crs_factory.get_transformer_to_w84_utm
+        )
+        # unknown EPSG codes fall back to themselves; keep the I75 column's dtype
+        # so both GPKGs get the same EPSG field type
+        epsg_out = (
+            df_id75["EPSG"].map(_EPSG_MAP).fillna(df_id75["EPSG"])
+            .astype(df_id75["EPSG"].dtype)
+        )
+
         # Overwrite/Add columns with WGS84 UTM values
-        df_W84[self.col_easting] = xs
-        df_W84[self.col_northing] = ys
-        df_W84["EPSG"] = epsg_out
+        df_W84 = df_id75.assign(
+            **{self.col_easting: xs, self.col_northing: ys, "EPSG": epsg_out}
+        )
         return df_W84
 
 
@@ -421,44 +507,69 @@ class GPKGWriter:
         df_I75: pd.DataFrame,
         df_W84: pd.DataFrame,
         prefix: str,
+        jobs: int = 1,
     ):
         # Use mode of EPSG as representative CRS for each output
-        epsg_mode_src = int(df_I75["EPSG"].mode()[0])
+        epsg_mode_src = _fast_mode_int(df_I75["EPSG"])
         crs_i75utm = self.crs_factory.get_src_crs(epsg_mode_src)
 
-        epsg_mode_w84utm = int(df_W84["EPSG"].mode()[0])
-        crs_w84utm = CRS.from_epsg(epsg_mode_w84utm)
+        epsg_mode_w84utm = _fast_mode_int(df_W84["EPSG"])
+        crs_w84utm = _crs_from_epsg(epsg_mode_w84utm)
 
         gpkg_i75utm_path = self.folder / f"{prefix}_I75UTM.gpkg"
         gpkg_w84utm_path = self.folder / f"{prefix}_W84UTM.gpkg"
 
-        self.write_gpkg( df_I75, gpkg_i75utm_path, crs_i75utm )
-        self.write_gpkg( df_W84, gpkg_w84utm_path, crs_w84utm )
+        if jobs <= 1:
+            self.write_gpkg( df_I75, gpkg_i75utm_path, crs_i75utm )
+            self.write_gpkg( df_W84, gpkg_w84utm_path, crs_w84utm )
+            return
+
+        # The two GPKGs are separate SQLite files, so they can be written
+        # concurrently; processes, since the OGR write loop holds the GIL.
+        with ProcessPoolExecutor(max_workers=min(jobs, 2)) as pool:
+            futures = [
+                pool.submit(self.write_gpkg, df_I75, gpkg_i75utm_path, crs_i75utm),
+                pool.submit(self.write_gpkg, df_W84, gpkg_w84utm_path, crs_w84utm),
+            ]
+            for fut in futures:
+                fut.result()
 
     def write_gpkg(self, df: pd.DataFrame, gpkg_path, crs):
-        for i, row in df.groupby('File'):
+        # ---- marker points (built once for all files) ----
+        x_all = df[self.col_easting].to_numpy()
+        y_all = df[self.col_northing].to_numpy()
+        gdf_markers = gpd.GeoDataFrame(
+            df,
+            # Use the configured column names for coordinates
+            geometry=gpd.points_from_xy(x_all, y_all),
+            crs=crs,
+        )
+        # rows already arrive grouped in file order (see MarkerLoader), no key sort needed
+        for i, gdf_marker in gdf_markers.groupby('File', sort=False, observed=True):
             print(f'Writing group {i} ...')
-            # ---- marker points ----
-            gdf_marker = gpd.GeoDataFrame(
-                row.copy(),
-                # Use the configured column names for coordinates
-                geometry=[Point(xy) for xy in zip(row[self.col_easting], row[self.col_northing])],
-                crs=crs,
+            gdf_marker.to_file(
+                gpkg_path, layer=f"marker:{i}", driver="GPKG",
+                engine=GPKG_ENGINE, **GPKG_LAYER_OPTIONS,
             )
-            gdf_marker.to_file(gpkg_path, layer=f"marker:{i}", driver="GPKG")
             # ---- polygon boundary ----
-            coords = list(zip(row[self.col_easting], row[self.col_northing]))
+            xy = np.column_stack([
+                gdf_marker[self.col_easting].to_numpy(),
+                gdf_marker[self.col_northing].to_numpy(),
+            ])
             # ensure closed ring
-            if len(coords) > 1 and coords[0] != coords[-1]:
-                coords.append(coords[0])
+            if len(xy) > 1 and not np.array_equal(xy[0], xy[-1]):
+                xy = np.vstack([xy, xy[:1]])
             # create Polygon instead of LineString
-            boundary_geom = Polygon(coords)
+            boundary_geom = shapely.polygons(xy)
             gdf_boundary = gpd.GeoDataFrame(
                 {"File": [i]},
                 geometry=[boundary_geom],
                 crs=crs
                 )
-            gdf_boundary.to_file(gpkg_path, layer=f"parcel:{i}", driver="GPKG")
+            gdf_boundary.to_file(
+                gpkg_path, layer=f"parcel:{i}", driver="GPKG",
+                engine=GPKG_ENGINE, **GPKG_LAYER_OPTIONS,
+            )
         print(f"[OK] Wrote GPKG → {gpkg_path}")
 
 
@@ -481,10 +592,12 @@ class MarkerProcessor:
         folder: Path,
         config_path: Path,
         gpkg_prefix: str,
+        jobs: int = 1,
     ):
         self.folder = folder
         self.config_path = config_path
         self.gpkg_prefix = gpkg_prefix
+        self.jobs = jobs
 
         # Load config
         self.config = RV25JConfig.from_toml(config_path)
@@ -518,7 +631,7 @@ class MarkerProcessor:
         )
 
         writer = GPKGWriter(self.folder, self.crs_factory)
-        writer.write_ID75_W84(df_ID75, df_W84, self.gpkg_prefix)
+        writer.write_ID75_W84(df_ID75, df_W84, self.gpkg_prefix, jobs=self.jobs)
 
 
 # =========================================
@@ -534,11 +647,23 @@ def parse_args():
         "folder",
         help="Root folder containing *_OCRedit.toml (recursively).",
     )
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Rewrite legacy [deed]/epsg/crs keys to [Deed].EPSG before processing (one-off).",
+    )
     parser.add_argument(
         "--gpkg-prefix",
         default="cadastre",
         help="Prefix for output GPKG files (default: 'cadastre').",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Write the I75UTM and W84UTM GPKGs in parallel processes (default: 1, serial). "
+             "Only pays off for large folders; process start-up dominates small ones.",
+    )
     return parser.parse_args()
 
 
@@ -552,10 +677,16 @@ def main():
         sys.exit(1)
 
     folder = Path(args.folder)
+    if args.migrate:
+        for toml_path in sorted(folder.rglob("*_OCRedit.toml")):
+            if MarkerLoader.migrate_legacy_toml(toml_path):
+                print(f"[MIGRATE] {toml_path}")
+
     processor = MarkerProcessor(
         folder=folder,
         config_path=config_path,
         gpkg_prefix=args.gpkg_prefix,
+        jobs=args.jobs,
     )
     processor.run()
 
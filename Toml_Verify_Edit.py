@@ -2,18 +2,13 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
 import os
+import re
 import shutil
 import json
-from PIL import Image, ImageTk
+import hashlib
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
-# For local plotting functionality
-try:
-    import matplotlib.pyplot as plt 
-    import numpy as np              
-    import pandas as pd 
-except ImportError:
-    plt = np = pd = None 
-    
 try:
     import tomllib 
 except ImportError:
@@ -22,10 +17,44 @@ except ImportError:
     except ImportError:
         tomllib = None
 
+# Plotting and imaging libraries are heavy and only needed once a plot is
+# shown, so they are imported on first use (_load_plot_libs / _load_pil).
+Figure = FigureCanvasAgg = np = None
+_plot_libs_ok = None
+Image = ImageTk = None
+
+
+def _load_plot_libs() -> bool:
+    """Imports matplotlib (Agg canvas, no pyplot) and numpy once; False if unavailable."""
+    global Figure, FigureCanvasAgg, np, _plot_libs_ok
+    if _plot_libs_ok is None:
+        try:
+            import matplotlib
+            matplotlib.rcParams['font.family'] = 'Tahoma'  # Thai-capable font, set once
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            import numpy as np
+            _plot_libs_ok = True
+        except ImportError:
+            _plot_libs_ok = False
+    return _plot_libs_ok
+
+
+def _load_pil():
+    """Imports PIL.Image / ImageTk on first use."""
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image, ImageTk
+
 # --- Configuration Constants ---
 DEFAULT_FONT = ('Tahoma', 10)
 TEXT_WIDTH = 35  
 TEXT_HEIGHT = 12 
+# Image stems look like '<base>_RV25J' (any case); shared with AppRV25J_Center and ImageSelect
+_RV25J_SUFFIX = re.compile(r'_RV25J$', re.IGNORECASE)
+# Editor texts shown when no TOML is loaded
+RAW_PLACEHOLDER = "# No OCR data loaded."
+EDIT_PLACEHOLDER = "# Press 'OCR' to generate data."
 # --- Global Configuration Option ---
 USE_SIMULATED_TOML = False 
 
@@ -51,6 +80,14 @@ marker = [
   [10, "J", "541", 711042.723, 810293.807],
 ]
 """
+# Written as-is by OCR_Process, so encode once at import
+_SIMULATED_OCR_TOML_BYTES = SIMULATED_OCR_TOML_CONTENT.encode('utf-8')
+
+
+def _strip_rv25j(stem: str) -> str:
+    """'<base>_RV25J' (any case) -> '<base>'; other stems are returned unchanged."""
+    return _RV25J_SUFFIX.sub('', stem)
+
 
 # Simple utility class for the text editor widget
 class TOMLTextEditor(tk.Text):
@@ -60,10 +97,20 @@ class TOMLTextEditor(tk.Text):
         self.config(undo=True, maxundo=50)
 
     def set_content(self, text):
-        self.config(state=tk.NORMAL)
+        # Skip the delete/insert when this exact text is already shown and unedited
+        text_hash = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        if text_hash == getattr(self, '_shown_hash', None) and not self.edit_modified():
+            self.config(state=tk.DISABLED)
+            return
+        # Loading is not an edit: keep it off the undo stack and drop the
+        # previous file's history, so Undo cannot restore another parcel's text
+        self.config(state=tk.NORMAL, undo=False)
         self.delete('1.0', tk.END)
         self.insert('1.0', text)
-        self.config(state=tk.DISABLED)
+        self.edit_reset()
+        self.config(state=tk.DISABLED, undo=True)
+        self._shown_hash = text_hash
+        self.edit_modified(False)
 
     def get_content(self):
         return self.get('1.0', tk.END).strip()
@@ -79,6 +126,12 @@ class OCRTomlEditor(ttk.Frame):
     2. Displaying editable verification output (R/W)
     3. Displaying a plot image (*_plot.png)
     """
+    # One Matplotlib figure shared by all plots (see _get_plot_axes)
+    _plot_fig = None
+    _plot_ax = None
+    # Background renderer for create_parcel_plot (see _get_plot_executor)
+    _plot_executor = None
+
     def __init__(self, master=None, log_callback=None, column_spec=None, **kwargs):
         super().__init__(master, **kwargs)
         self.log_callback = log_callback if log_callback else print
@@ -88,8 +141,30 @@ class OCRTomlEditor(ttk.Frame):
         
         # Expects *_RV25J.jpg
         self.current_image_path: Path = None  
+        # Set by load_files: the parcel's base name and its folder (<root>/<base>)
+        self._base_name: str = None
+        self._item_dir: Path = None
+        # Verification editor fill deferred by load_files via after_idle
+        self._edit_fill_job = None
+        self._edit_fill_text: str = None
         self.plot_tk_image = None 
         self.current_plot_path: Path = None 
+        # Decoded plot kept in memory so resizes only rescale, never re-read the PNG
+        self._plot_source = None
+        self._plot_source_path: Path = None
+        self._plot_source_mtime = None
+        self._resize_job = None
+        # Last plot canvas size seen in <Configure>; 0 until first mapped
+        self._canvas_w = 0
+        self._canvas_h = 0
+        # (w, h, final) of the plot currently on the canvas
+        self._plot_drawn = None
+        # In-flight _render_plot job; a newer request replaces (and cancels) it
+        self._plot_future = None
+        # Parsed TOML per file, reused while (mtime_ns, size) is unchanged
+        self._toml_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+        # Digest of the editor text last loaded/saved per *_OCRedit.toml (see _content_hash)
+        self._last_saved_hash: dict[Path, bytes] = {}
 
         self.columnconfigure(0, weight=1)
         
@@ -145,83 +220,145 @@ class OCRTomlEditor(ttk.Frame):
             height=200 
         )
         self.plot_canvas.grid(row=5, column=0, sticky='nsew', padx=5, pady=(0, 5))
+        # Two long-lived canvas items, reconfigured instead of deleted/recreated
+        self._placeholder_id = self.plot_canvas.create_text(
+            0, 0, text="Plot Image Area", fill="#666", anchor=tk.CENTER
+        )
+        self._image_item_id = self.plot_canvas.create_image(0, 0, anchor=tk.NW, state='hidden')
         self.grid_rowconfigure(5, weight=1) 
         
     def on_plot_canvas_resize(self, event):
-        """Handles canvas resize event by reloading and scaling the current plot image."""
+        """Handles canvas resize event: cheap BILINEAR preview now, LANCZOS once the drag settles."""
+        self._canvas_w, self._canvas_h = event.width, event.height
         if self.current_plot_path and event.width > 1 and event.height > 1:
-            # Prevent excessive logging on every pixel shift
-            if self.current_plot_path.exists():
-                self.load_plot_image(self.current_plot_path)
+            if self._plot_drawn is not None and self._plot_drawn[:2] == (event.width, event.height):
+                return  # e.g. a move, or the final size already drawn
+            if self._resize_job is not None:
+                self.after_cancel(self._resize_job)
+            if self._plot_available(self.current_plot_path):
+                self.load_plot_image(self.current_plot_path, final=False)
+            self._resize_job = self.after(120, self._do_resize)
+
+    def _do_resize(self):
+        """Rescales the current plot image once the <Configure> events have settled."""
+        self._resize_job = None
+        if self._plot_drawn == (self._canvas_w, self._canvas_h, True):
+            return
+        if self.current_plot_path and self._plot_available(self.current_plot_path):
+            self.load_plot_image(self.current_plot_path)
 
     def reset_editors(self):
         """Clears content and disables the editors."""
+        self._cancel_edit_fill()
         self.raw_ocr_editor.config(state=tk.NORMAL)
         self.edit_ocr_editor.config(state=tk.NORMAL, background='yellow')
         
-        self.raw_ocr_editor.set_content("# No OCR data loaded.")
-        self.edit_ocr_editor.set_content("# Press 'OCR' to generate data.")
+        self.raw_ocr_editor.set_content(RAW_PLACEHOLDER)
+        self.edit_ocr_editor.set_content(EDIT_PLACEHOLDER)
         
         self.raw_ocr_editor.config(state=tk.DISABLED)
         self.edit_ocr_editor.config(state=tk.DISABLED, background='#f0f0f0')
         
-        self.plot_canvas.delete(tk.ALL)
-        self.plot_tk_image = None
+        self._reset_plot()
+
+    def _reset_plot(self):
+        """Clears the plot canvas back to its placeholder."""
+        if self._plot_future is not None:
+            # A render still running for the previous parcel must not land here
+            self._plot_future.cancel()
+            self._plot_future = None
+        self._hide_plot_image()
         self.current_plot_path = None 
-        self.plot_canvas.create_text(
-            self.plot_canvas.winfo_width() / 2, self.plot_canvas.winfo_height() / 2, 
-            text="Plot Image Area", fill="#666", anchor=tk.CENTER
+        self._show_plot_placeholder("Plot Image Area", "#666")
+
+    def _hide_plot_image(self):
+        self.plot_canvas.itemconfigure(self._image_item_id, image='', state='hidden')
+        self.plot_canvas.itemconfigure(self._placeholder_id, state='hidden')
+        self.plot_tk_image = None
+        self._plot_drawn = None
+
+    def _show_plot_placeholder(self, text: str, fill: str):
+        """Shows the centred placeholder text item with the given message."""
+        self.plot_canvas.coords(
+            self._placeholder_id,
+            self.plot_canvas.winfo_width() / 2, self.plot_canvas.winfo_height() / 2
         )
+        self.plot_canvas.itemconfigure(self._placeholder_id, text=text, fill=fill, state='normal')
+
+    def _flush_edit_fill(self):
+        """Puts the text queued by load_files into the verification editor (now, if still pending)."""
+        if self._edit_fill_job is None:
+            return
+        self.after_cancel(self._edit_fill_job)
+        self._edit_fill_job = None
+        self.edit_ocr_editor.set_content(self._edit_fill_text)
+        self.edit_ocr_editor.config(state=tk.DISABLED, background='#f0f0f0')
+        self._edit_fill_text = None
+
+    def _cancel_edit_fill(self):
+        if self._edit_fill_job is not None:
+            self.after_cancel(self._edit_fill_job)
+            self._edit_fill_job = None
+            self._edit_fill_text = None
+
+    def _toml_paths(self) -> tuple[Path, Path, Path]:
+        """(*_OCR.toml, *_OCRedit.toml, *_plot.png) of the parcel loaded by load_files."""
+        d, b = self._item_dir, self._base_name
+        return d / f"{b}_OCR.toml", d / f"{b}_OCRedit.toml", d / f"{b}_plot.png"
 
     def load_files(self, parent_dir: Path, base_name_str: str):
         """
         Loads the corresponding *_OCR.toml, *_OCRedit.toml, and *_plot.png 
         for the given directory and base file name.
         """
-        self.current_image_path = parent_dir / base_name_str / f"{base_name_str}_RV25J.jpg"
+        self._base_name = base_name_str
+        self._item_dir = parent_dir / base_name_str
+        self.current_image_path = self._item_dir / f"{base_name_str}_RV25J.jpg"
         
-        ocr_toml_path = parent_dir / base_name_str / f"{base_name_str}_OCR.toml"
-        edit_toml_path = parent_dir / base_name_str / f"{base_name_str}_OCRedit.toml"
-        plot_png_path = parent_dir / base_name_str / f"{base_name_str}_plot.png" 
+        ocr_toml_path, edit_toml_path, plot_png_path = self._toml_paths()
         #import pdb; pdb.set_trace()
-        self.reset_editors()
+        # Editors are not blanked first: set_content leaves a pane alone when
+        # the same text is already shown, so re-selecting a parcel is cheap.
+        self._cancel_edit_fill()
+        self._reset_plot()
         
         # --- Load Raw OCR TOML ---
+        raw_content = None
         self.log(f"I/O READ: Checking for Raw OCR TOML: {ocr_toml_path.name}")
         if ocr_toml_path.exists():
             try:
                 raw_content = ocr_toml_path.read_text(encoding='utf-8')
-                self.raw_ocr_editor.config(state=tk.NORMAL)
                 self.raw_ocr_editor.set_content(raw_content)
-                self.raw_ocr_editor.config(state=tk.DISABLED)
                 self.log(f"SUCCESS: Loaded raw OCR TOML from {ocr_toml_path.name}.")
             except Exception as e:
                 self.log(f"ERROR: Failed to read raw OCR TOML {ocr_toml_path.name}: {e}")
         else:
             self.log(f"WARNING: Raw OCR TOML not found: {ocr_toml_path.name}.")
+        if raw_content is None:
+            self.raw_ocr_editor.set_content(RAW_PLACEHOLDER)
 
         # --- Load Editable TOML ---
+        edit_content = None
         self.log(f"I/O READ: Checking for Editable TOML: {edit_toml_path.name}")
         if edit_toml_path.exists():
             try:
                 edit_content = edit_toml_path.read_text(encoding='utf-8')
-                self.edit_ocr_editor.config(state=tk.NORMAL)
-                self.edit_ocr_editor.set_content(edit_content)
-                self.edit_ocr_editor.config(state=tk.DISABLED, background='#f0f0f0') 
+                self._last_saved_hash[edit_toml_path] = self._content_hash(edit_content.strip())
                 self.log(f"SUCCESS: Loaded editable TOML from {edit_toml_path.name}.")
             except Exception as e:
                 self.log(f"ERROR: Failed to read editable TOML {edit_toml_path.name}: {e}")
-        elif ocr_toml_path.exists():
+        elif raw_content is not None:
             try:
                 self.log(f"I/O WRITE: Copying {ocr_toml_path.name} to {edit_toml_path.name}")
-                shutil.copy(ocr_toml_path, edit_toml_path)
-                edit_content = ocr_toml_path.read_text(encoding='utf-8')
-                self.edit_ocr_editor.config(state=tk.NORMAL)
-                self.edit_ocr_editor.set_content(edit_content)
-                self.edit_ocr_editor.config(state=tk.DISABLED, background='#f0f0f0')
+                shutil.copyfile(ocr_toml_path, edit_toml_path)
+                edit_content = raw_content  # same bytes, already read above
+                self._last_saved_hash[edit_toml_path] = self._content_hash(edit_content.strip())
                 self.log(f"SUCCESS: Copied {ocr_toml_path.name} to {edit_toml_path.name} for editing.")
             except Exception as e:
                 self.log(f"ERROR: Failed to copy OCR TOML for editing: {e}")
+        # Filled once the click has returned to Tk (see _flush_edit_fill)
+        self._edit_fill_text = edit_content if edit_content is not None else EDIT_PLACEHOLDER
+        self._edit_fill_job = self.after_idle(self._flush_edit_fill)
         
         # --- Plotting ---
         self.current_plot_path = plot_png_path 
@@ -231,24 +368,49 @@ class OCRTomlEditor(ttk.Frame):
         self.load_plot_image(plot_png_path) 
         
         # 2. Re-create the plot based on the TOML data
-        if edit_toml_path.exists() and plt is not None:
-             self.create_parcel_plot(edit_toml_path)
+        if edit_toml_path.exists() and _load_plot_libs():
+             # Parse the text already shown in the editor rather than reading it again
+             self.create_parcel_plot(edit_toml_path, preloaded_text=edit_content)
         
 
-    def load_plot_image(self, plot_path: Path):
-        """Loads and scales the plot image to fit the canvas."""
+    def _plot_in_memory(self, plot_path: Path) -> bool:
+        """True if plot_path was just rendered here and its image is held in memory."""
+        return (self._plot_source is not None and plot_path == self._plot_source_path
+                and self._plot_source_mtime is None)
+
+    def _plot_available(self, plot_path: Path) -> bool:
+        return self._plot_in_memory(plot_path) or plot_path.exists()
+
+    def load_plot_image(self, plot_path: Path, final: bool = True):
+        """
+        Loads and scales the plot image to fit the canvas.
+        final=False uses BILINEAR for fast previews while a resize is in progress.
+        """
         
         if plot_path == self.current_plot_path:
-             self.plot_canvas.delete(tk.ALL)
-             self.plot_tk_image = None
+             self._hide_plot_image()
         
-        if plot_path.exists():
+        if self._plot_available(plot_path):
             try:
-                pil_image = Image.open(plot_path)
+                _load_pil()
+                # A freshly rendered plot is used from memory: it is the image just rendered,
+                # so there is no need to stat and re-decode the PNG written alongside it
+                mtime = None if self._plot_in_memory(plot_path) else plot_path.stat().st_mtime_ns
+                if (self._plot_source is None or plot_path != self._plot_source_path
+                        or mtime != self._plot_source_mtime):
+                    src = Image.open(plot_path)
+                    src.load()  # decode now; also releases the file handle
+                    self._plot_source = src
+                    self._plot_source_path = plot_path
+                    self._plot_source_mtime = mtime
+                pil_image = self._plot_source
                 
-                self.update_idletasks()
-                canvas_w = self.plot_canvas.winfo_width()
-                canvas_h = self.plot_canvas.winfo_height()
+                canvas_w, canvas_h = self._canvas_w, self._canvas_h
+                if not canvas_w or not canvas_h:
+                    # No <Configure> seen yet (first load): ask Tk once
+                    self.update_idletasks()
+                    canvas_w = self._canvas_w = self.plot_canvas.winfo_width()
+                    canvas_h = self._canvas_h = self.plot_canvas.winfo_height()
                 
                 if canvas_w < 10 or canvas_h < 10: return
 
@@ -259,7 +421,10 @@ class OCRTomlEditor(ttk.Frame):
                 new_h = int(img_h * scale)
                 
                 if scale < 1.0:
-                    resized_image = pil_image.resize((new_w, new_h), Image.Resampling.LANCZOS)
+                    resample = Image.Resampling.LANCZOS if final else Image.Resampling.BILINEAR
+                    # reducing_gap: integer box-reduce first when the plot is >2x the
+                    # canvas, so the expensive filter only runs on the last step
+                    resized_image = pil_image.resize((new_w, new_h), resample, reducing_gap=2.0)
                 else:
                     resized_image = pil_image
                 
@@ -268,33 +433,44 @@ class OCRTomlEditor(ttk.Frame):
                 x_center = (canvas_w - new_w) // 2
                 y_center = (canvas_h - new_h) // 2
                 
-                self.plot_canvas.create_image(x_center, y_center, image=self.plot_tk_image, anchor=tk.NW)
+                self.plot_canvas.itemconfigure(self._placeholder_id, state='hidden')
+                self.plot_canvas.coords(self._image_item_id, x_center, y_center)
+                self.plot_canvas.itemconfigure(self._image_item_id, image=self.plot_tk_image, state='normal')
+                self._plot_drawn = (canvas_w, canvas_h, final)
 
             except Exception as e:
                 self.log(f"ERROR: Failed to load plot image {plot_path.name}: {e}")
         else:
-            self.plot_canvas.create_text(
-                self.plot_canvas.winfo_width() / 2, self.plot_canvas.winfo_height() / 2, 
-                text=f"Plot Image Not Found: {plot_path.name}", fill="#888", anchor=tk.CENTER
-            )
+            self._show_plot_placeholder(f"Plot Image Not Found: {plot_path.name}", "#888")
     
-    def _extract_and_parse_markers(self, toml_path: Path) -> list[list]:
+    def _extract_and_parse_markers(self, toml_path: Path, toml_data: dict = None,
+                                   preloaded_text: str = None) -> list[list]:
         """
-        Reads the TOML file and extracts the marker array using the tomllib library.
+        Extracts the marker array from already-parsed TOML data, or parses
+        toml_path with tomllib when no data is given. preloaded_text is the
+        file's content already read by the caller, so the disk read is skipped.
         """
-        if tomllib is None:
+        if toml_data is None and tomllib is None:
             self.log("ERROR: 'tomllib' is required. Cannot parse TOML.")
             return []
 
-        if not toml_path.exists():
+        if toml_data is None and not toml_path.exists():
             self.log(f"WARNING: TOML file not found: {toml_path.name}.")
             return []
 
         try:
-            self.log(f"INFO: Using tomllib to parse {toml_path.name}.")
-            
-            with open(toml_path, 'rb') as f:
-                toml_data = tomllib.load(f)
+            if toml_data is None:
+                st = toml_path.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._toml_cache.get(toml_path)
+                if cached is not None and cached[0] == key:
+                    toml_data = cached[1]
+                else:
+                    self.log(f"INFO: Using tomllib to parse {toml_path.name}.")
+                    if preloaded_text is None:
+                        preloaded_text = toml_path.read_text(encoding='utf-8')
+                    toml_data = tomllib.loads(preloaded_text)
+                    self._toml_cache[toml_path] = (key, toml_data)
 
             marker_data = toml_data.get('Deed', {}).get('marker')
 
@@ -308,47 +484,68 @@ class OCRTomlEditor(ttk.Frame):
             self.log(f"ERROR: Failed to parse markers from {toml_path.name}: {e}")
             return []
 
-    def create_parcel_plot(self, toml_path: Path):
+    def _get_plot_axes(self):
+        """Returns the shared (fig, ax), created on first use and cleared on every call."""
+        cls = type(self)
+        if cls._plot_fig is None:
+            cls._plot_fig = Figure(figsize=(6, 5))
+            FigureCanvasAgg(cls._plot_fig)
+            cls._plot_ax = cls._plot_fig.add_subplot(111)
+            # Set the face color of the figure explicitly
+            cls._plot_fig.set_facecolor('white')
+            # Margins fixed once here (room for 6-7 digit UTM tick labels)
+            # instead of a bbox_inches='tight' measuring pass on every save
+            cls._plot_fig.subplots_adjust(left=0.16, right=0.97, bottom=0.1, top=0.93)
+        cls._plot_ax.clear()
+        cls._plot_ax.set_facecolor('white')
+        return cls._plot_fig, cls._plot_ax
+
+    def create_parcel_plot(self, toml_path: Path, toml_data: dict = None,
+                           preloaded_text: str = None):
         """
         Creates a Matplotlib plot with THAI FONT, Area Calculation, and Centroid Labeling.
+        If toml_data is given it is used as-is and toml_path only names the output;
+        preloaded_text is the already-read file content (see _extract_and_parse_markers).
         """
 
-        if plt is None or pd is None or np is None:
+        if not _load_plot_libs():
             self.log("ERROR: Matplotlib libraries not found.")
             return
 
-        marker_data = self._extract_and_parse_markers(toml_path)
+        marker_data = self._extract_and_parse_markers(toml_path, toml_data, preloaded_text)
         #import pdb ;pdb.set_trace()        
         if not marker_data:
             self.log("WARNING: Cannot create plot. No marker data available.")
             return
 
-        df = pd.DataFrame(marker_data)
-        
-        expected_columns = ['NUM_SEQ', 'MRK_SEQ'] + ["MRK_DOL", "NORTHING", "EASTING"]
-        expected_count = len(expected_columns)
-        actual_count = len(df.columns)
-        
-        if actual_count == expected_count:
-            df.columns = expected_columns
-        else:
-            self.log(f"WARNING: Plotting skipped. Mismatch columns. Expected {expected_count}, got {actual_count}.")
+        # Rows are [NUM_SEQ, MRK_SEQ, MRK_DOL, NORTHING, EASTING]
+        expected_count = 5
+        bad_rows = [r for r in marker_data if len(r) != expected_count]
+        if bad_rows:
+            self.log(f"WARNING: Plotting skipped. Mismatch columns. Expected {expected_count}, got {len(bad_rows[0])}.")
             return 
 
         col_easting = "EASTING"
         col_northing = "NORTHING"
-        col_marker = "MRK_DOL"
+
+        # One transpose of the rows into per-column lists
+        _, seqs, mrks, northing, easting = map(list, zip(*marker_data))
 
         # --- AREA & UNIT CALCULATION (Shoelace Formula) ---
-        x_coords = df[col_easting].to_numpy()
-        y_coords = df[col_northing].to_numpy()
+        x_coords = np.asarray(easting, dtype=float)
+        y_coords = np.asarray(northing, dtype=float)
         
         # Calculate signed area using Shoelace formula
         # Area = 0.5 * | sum(x_i * y_{i+1} - x_{i+1} * y_i) |
-        # We use np.roll to shift the array indices for the i+1 term
-        # This handles the closing of the loop automatically if data isn't explicitly closed,
-        # but Shoelace works best if vertices are ordered (perimeter).
-        area_sqm = 0.5 * np.abs(np.dot(x_coords, np.roll(y_coords, 1)) - np.dot(y_coords, np.roll(x_coords, 1)))
+        # The i+1 terms use zero-copy slice views (no np.roll temporaries);
+        # the closing edge (last -> first) is added explicitly, so the loop
+        # need not be closed in the data. Shoelace needs ordered (perimeter) vertices.
+        x1, x2 = x_coords[:-1], x_coords[1:]
+        y1, y2 = y_coords[:-1], y_coords[1:]
+        area_sqm = 0.5 * abs(
+            np.dot(x1, y2) - np.dot(x2, y1)
+            + x_coords[-1] * y_coords[0] - x_coords[0] * y_coords[-1]
+        )
         
         # Convert to Thai Units
         # 1 Rai = 1600 sqm, 1 Ngan = 400 sqm, 1 Sq Wah = 4 sqm
@@ -366,105 +563,154 @@ class OCRTomlEditor(ttk.Frame):
         cy = np.mean(y_coords)
 
         # --- PLOTTING ---
-        easting = df[col_easting].tolist()
-        northing = df[col_northing].tolist()
-
         # Close the loop for drawing
-        if easting[0] != easting[-1] or northing[0] != northing[-1]:
+        if (easting[0], northing[0]) != (easting[-1], northing[-1]):
              easting.append(easting[0])
              northing.append(northing[0])
         
         parent_dir = toml_path.parent
         base_name_str = parent_dir.name 
         plot_png_path = parent_dir / f"{base_name_str}_plot.png" 
+
+        # Render off the Tk thread; only the newest request is displayed
+        if self._plot_future is not None:
+            self._plot_future.cancel()
+        self.log(f"I/O WRITE: Saving plot to {plot_png_path.name}")
+        future = self._get_plot_executor().submit(
+            self._render_plot, plot_png_path, toml_path.name, seqs, mrks,
+            easting, northing, cx, cy, area_text
+        )
+        self._plot_future = future
+        self.after(15, self._poll_plot_render, future, plot_png_path)
+
+    @classmethod
+    def _get_plot_executor(cls) -> ThreadPoolExecutor:
+        """Single worker shared by all editors, so the shared figure is never drawn concurrently."""
+        if cls._plot_executor is None:
+            cls._plot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parcel-plot")
+        return cls._plot_executor
+
+    def _render_plot(self, plot_png_path: Path, title_name: str, seqs: list, mrks: list,
+                     easting: list, northing: list, cx, cy, area_text: str):
+        """
+        Worker thread: draws the parcel on the shared Agg figure, writes the PNG
+        and returns (decoded PIL image, log message). Must not touch Tk.
+        """
+        col_easting = "EASTING"
+        col_northing = "NORTHING"
+
+        fig, ax = self._get_plot_axes()
         
-        try:
-            # --- FONT CONFIGURATION FOR THAI ---
-            plt.rcParams['font.family'] = 'Tahoma'
-            fig, ax = plt.subplots(figsize=(6, 5))
+        # Plot Polygon
+        ax.plot(
+            easting, 
+            northing, 
+            color='red', 
+            linewidth=2, 
+            marker='o', 
+            markersize=8,  # Increased size
+            markerfacecolor='white',  # Creates the white hole
+            markeredgecolor='red'     # Ensures the perimeter remains red
+        )
         
-            # Set the face color of the figure and the axes explicitly
-            fig.set_facecolor('white') 
-            ax.set_facecolor('white')
-            
-            # Plot Polygon
-            ax.plot(
-                easting, 
-                northing, 
-                color='red', 
-                linewidth=2, 
-                marker='o', 
-                markersize=8,  # Increased size
-                markerfacecolor='white',  # Creates the white hole
-                markeredgecolor='red'     # Ensures the perimeter remains red
+        ax.fill(easting, northing, color='red', alpha=0.1)
+
+        # Plot Marker Labels
+        # Adjust y-offset based on range to prevent overlap with the polygon line
+        y_offset = (max(northing) - min(northing)) * 0.005
+        # zip stops at the markers, ignoring the closing point appended to easting/northing
+        for seq, mrk, n, e in zip(seqs, mrks, northing, easting):
+            ax.text(
+                e, 
+                n + y_offset, 
+                f"{seq}: {mrk}", 
+                color='blue', 
+                fontsize=14, 
+                ha='center', 
+                va='bottom'
             )
-            
-            x_arr = np.array(easting)
-            y_arr = np.array(northing)
-            ax.fill(x_arr, y_arr, color='red', alpha=0.1)
-
-            # Plot Marker Labels
-            for _, row in df.iterrows():
-                label = f"{row['MRK_SEQ']}: {row[col_marker]}"
-                ax.text(
-                    row[col_easting], 
-                    # Adjust y-offset based on range to prevent overlap with the polygon line
-                    row[col_northing] + (np.max(northing) - np.min(northing)) * 0.005, 
-                    label, 
-                    color='blue', 
-                    fontsize=14, 
-                    ha='center', 
-                    va='bottom'
-                )
-
-            # Plot Area Text at Centroid
-            ax.text(cx, cy, area_text, 
-                    color='darkred', 
-                    fontsize=14, 
-                    fontweight='bold',
-                    ha='center', 
-                    va='center',
-                    bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', pad=3))
-
-            # REMAINING PLOT SETUP/SAVE CODE WOULD FOLLOW HERE
-            ax.set_xlabel(f'{col_easting} (m)')
-            ax.set_ylabel(f'{col_northing} (m)')
-            ax.set_title(f"Parcel Plot: {toml_path.name}")
-            ax.grid(True, linestyle='--', alpha=0.6) 
-            ax.set_aspect('equal', adjustable='box') 
-            
-            self.log(f"I/O WRITE: Saving plot to {plot_png_path.name}")
-            plt.savefig(plot_png_path, bbox_inches='tight', facecolor='white')
-            plt.clf()       # Clear the current figure (optional)
-            plt.close(fig)  # Close the specific figure 
-            plt.close('all')  # Ensures all hidden figures are closed (optional)
-            
-            self.log(f"SUCCESS: Saved plot to {plot_png_path.name}")
-            
-            self.current_plot_path = plot_png_path 
-            self.load_plot_image(plot_png_path)
 
+        # Plot Area Text at Centroid
+        ax.text(cx, cy, area_text, 
+                color='darkred', 
+                fontsize=14, 
+                fontweight='bold',
+                ha='center', 
+                va='center',
+                bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', pad=3))
+
+        ax.set_xlabel(f'{col_easting} (m)')
+        ax.set_ylabel(f'{col_northing} (m)')
+        ax.set_title(f"Parcel Plot: {title_name}")
+        ax.grid(True, linestyle='--', alpha=0.6) 
+        ax.set_aspect('equal', adjustable='box') 
+        
+        # Render to memory: the canvas shows this image directly, so the
+        # PNG file only has to be written, never read back
+        buf = BytesIO()
+        fig.savefig(buf, format='png', dpi=72, facecolor='white',
+                    pil_kwargs={'compress_level': 1})
+
+        _load_pil()
+        buf.seek(0)
+        pil_image = Image.open(buf)
+        pil_image.load()
+
+        try:
+            plot_png_path.write_bytes(buf.getvalue())
+            msg = f"SUCCESS: Saved plot to {plot_png_path.name}"
+        except Exception as e:
+            msg = f"ERROR: Failed to write plot {plot_png_path.name}: {e}"
+        return pil_image, msg
+
+    def _poll_plot_render(self, future, plot_png_path: Path):
+        """Tk thread: waits for a _render_plot future, then shows its image."""
+        if future is not self._plot_future:
+            return  # superseded by a newer plot request
+        if not future.done():
+            self.after(15, self._poll_plot_render, future, plot_png_path)
+            return
+        self._plot_future = None
+        try:
+            pil_image, msg = future.result()
         except Exception as e:
             self.log(f"ERROR creating Matplotlib plot: {e}")
+            return
+        self.log(msg)
+
+        self._plot_source = pil_image
+        self._plot_source_path = plot_png_path
+        self._plot_source_mtime = None  # see _plot_in_memory
+        
+        self.current_plot_path = plot_png_path 
+        self.load_plot_image(plot_png_path)
 
     def on_save_or_edit_click(self):
         """
         Toggles the editor state: saves when switching from editable to read-only.
         """
+        self._flush_edit_fill()
         if self.edit_ocr_editor.cget('state') == tk.NORMAL:
             # Currently editing -> Perform Save and Disable
-            save_successful = self.save_edited_toml()
+            content = self.edit_ocr_editor.get_content()
+            edit_toml_path = self._toml_paths()[1] if self.current_image_path else None
+            # save_edited_toml only updates the digest when it actually writes
+            prev_hash = self._last_saved_hash.get(edit_toml_path)
+            save_successful = self.save_edited_toml(content)
             if save_successful:
-                # Reload/Regenerate plot after successful save
-                parent_dir = self.current_image_path.parent
-                base_name_for_toml = self.current_image_path.stem
-                if base_name_for_toml.lower().endswith('_rv25j'):
-                    base_name_for_toml = base_name_for_toml[:-6]
-                
-                edit_toml_path = parent_dir / f"{base_name_for_toml}_OCRedit.toml"
-                
-                if plt is not None:
-                     self.create_parcel_plot(edit_toml_path)
+                # Reload/Regenerate plot after a save that changed the file
+                if self._last_saved_hash.get(edit_toml_path) == prev_hash:
+                    self.log("INFO: TOML unchanged; keeping the current plot.")
+                elif _load_plot_libs():
+                    # Plot from the saved text directly instead of re-reading the file
+                    toml_data = None
+                    if tomllib is not None:
+                        try:
+                            toml_data = tomllib.loads(content)
+                        except Exception as e:
+                            self.log(f"ERROR: Failed to parse markers from {edit_toml_path.name}: {e}")
+                    if toml_data is not None:
+                        self.create_parcel_plot(edit_toml_path, toml_data)
                 
                 self.edit_ocr_editor.config(background='#f0f0f0') 
                 self.log("Action: Verification TOML editor disabled (Saved).")
@@ -483,24 +729,45 @@ class OCRTomlEditor(ttk.Frame):
             self.log("INFO: Skipping simulated OCR process. Relying on external *_OCR.toml.")
             return True
 
-        parent_dir = self.current_image_path.parent
-        base_name_str = self.current_image_path.stem
-        if base_name_str.lower().endswith('_rv25j'):
-            base_name_str = base_name_str[:-6] 
-
-        ocr_toml_path = parent_dir / f"{base_name_str}_OCR.toml"
-        
         try:
-            self.log(f"I/O WRITE: Writing simulated OCR data to {ocr_toml_path.name}")
-            with open(ocr_toml_path, 'w', encoding='utf-8') as f:
-                f.write(SIMULATED_OCR_TOML_CONTENT)
+            if is_all:
+                ocr_toml_paths = self._scan_ocr_targets(self._item_dir.parent)
+                self.log(f"I/O WRITE: Writing simulated OCR data for {len(ocr_toml_paths)} images")
+            else:
+                ocr_toml_paths = [self._toml_paths()[0]]
+                self.log(f"I/O WRITE: Writing simulated OCR data to {ocr_toml_paths[0].name}")
+
+            for ocr_toml_path in ocr_toml_paths:
+                ocr_toml_path.write_bytes(_SIMULATED_OCR_TOML_BYTES)
             
-            self.log(f"SUCCESS: Simulated OCR result saved to {ocr_toml_path.name}.")
+            self.log(f"SUCCESS: Simulated OCR result saved to {len(ocr_toml_paths)} *_OCR.toml file(s).")
             return True
         except Exception as e:
             self.log(f"ERROR saving simulated OCR TOML: {e}")
             return False
 
+    @staticmethod
+    def _scan_ocr_targets(root_dir: Path) -> list[Path]:
+        """
+        *_OCR.toml paths for every <root>/<base>/<base>_RV25J.jpg, found with a
+        single os.scandir pass per folder (no glob, no extra stat calls).
+        """
+        targets = []
+        with os.scandir(root_dir) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                with os.scandir(folder.path) as entries:
+                    for entry in entries:
+                        stem, ext = entry.name[:-4], entry.name[-4:]
+                        if ext.lower() != '.jpg':
+                            continue
+                        base = _strip_rv25j(stem)
+                        if base != stem and entry.is_file():
+                            targets.append(Path(folder.path) / f"{base}_OCR.toml")
+        targets.sort()
+        return targets
+
     def on_ocr_click(self, is_all=False):
         """Handles the event when OCR buttons are clicked."""
         if not self.current_image_path:
@@ -515,15 +782,15 @@ class OCRTomlEditor(ttk.Frame):
             process_success = self.OCR_Process(is_all=False)
             
         if process_success:
-            parent_dir = self.current_image_path.parent
-            base_name_str = self.current_image_path.stem
-            if base_name_str.lower().endswith('_rv25j'):
-                base_name_str = base_name_str[:-6] 
-                
-            self.load_files(parent_dir, base_name_str)
+            self.load_files(self._item_dir.parent, self._base_name)
         
-    def save_edited_toml(self):
-        """Saves content to *_OCRedit.toml."""
+    @staticmethod
+    def _content_hash(content: str) -> bytes:
+        """Short digest of editor text, used to detect no-op saves."""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest()
+
+    def save_edited_toml(self, content: str = None):
+        """Saves content (the editor text by default) to *_OCRedit.toml."""
         if self.edit_ocr_editor.cget('state') == tk.DISABLED:
             self.log("ERROR: Cannot save. Editor is disabled. Click 'Edit/Save TOML' first.")
             return False
@@ -532,17 +799,21 @@ class OCRTomlEditor(ttk.Frame):
             self.log("ERROR: No current image path available for saving.")
             return False
 
-        parent_dir = self.current_image_path.parent
-        base_name_str = self.current_image_path.stem
-        if base_name_str.lower().endswith('_rv25j'):
-            base_name_str = base_name_str[:-6]
-            
-        edit_toml_path = parent_dir / f"{base_name_str}_OCRedit.toml"
+        edit_toml_path = self._toml_paths()[1]
         
-        content = self.edit_ocr_editor.get_content()
+        if content is None:
+            content = self.edit_ocr_editor.get_content()
+
+        content_hash = self._content_hash(content)
+        if self._last_saved_hash.get(edit_toml_path) == content_hash and edit_toml_path.exists():
+            self.log(f"INFO: No changes to {edit_toml_path.name}; nothing written.")
+            self.edit_ocr_editor.config(state=tk.DISABLED)
+            return True
 
         try:
             edit_toml_path.write_text(content, encoding='utf-8')
+            self._toml_cache.pop(edit_toml_path, None)
+            self._last_saved_hash[edit_toml_path] = content_hash
             self.log(f"SUCCESS: Verification TOML saved to {edit_toml_path.name}.")
             self.edit_ocr_editor.config(state=tk.DISABLED)
             return True
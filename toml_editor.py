@@ -1,18 +1,98 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import os
 import re
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
 
 # --- GLOBAL CONFIGURATION CONSTANTS (User Configurable) ---
 TEXT_WIDTH = 80             # Width in characters
 TEXT_HEIGHT = 25            # Height in lines
 TEXT_FONT_FAMILY = 'Tahoma'  # Font family (e.g., 'TlwgTypewriter', 'Arial', 'Tahoma')
 TEXT_FONT_SIZE = 12         # Font size in points
+HIGHLIGHT_DELAY_MS = 450    # Pause in typing before the edited lines are re-highlighted
+HIGHLIGHT_OVERSCAN = 20     # Lines highlighted above/below the visible area
+
+# --- TOML SYNTAX PATTERNS (compiled once, used by TOMLTextEditor._highlight_syntax) ---
+_RE_TABLE = re.compile(r'^(\s*\[\[?.*?\]\]?\s*)$')
+# Bare, "basic" or 'literal' quoted key parts, optionally dotted (a.b, "x y".z)
+_KEY_PART = r'''(?:[\w\-]+|"(?:[^"\\]|\\.)*"|'[^']*')'''
+_RE_KEY = re.compile(rf'^(\s*{_KEY_PART}(?:\s*\.\s*{_KEY_PART})*)\s*=')
+# Values and comments: one left-to-right scan, the group name (match.lastgroup) is the tag.
+# datetime is tried before number_bool so its digits are not tagged as numbers,
+# and nothing inside a string is tagged as a number or date.  A comment match
+# runs to the end of the line, so the scan stops there; a '#' inside a string
+# is consumed by the string and does not start a comment.  Each quote style has
+# its own body class, so an unclosed quote fails in one linear pass.
+_RE_INLINE = re.compile(
+    r'(?P<string>"(?:[^"\\]|\\.)*"|\'[^\']*\')'
+    r'|(?P<datetime>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:[+-]\d{2}:\d{2}|Z)?)'
+    r'|(?P<number_bool>\b(?:true|false)\b|\b\d+(?:\.\d*)?(?:[eE][+-]?\d+)?\b)'
+    r'|(?P<comment>#.*)'
+)
+# Every pattern above needs one of these characters ('t'/'f' for true/false),
+# so a line without any of them cannot be highlighted
+_INTERESTING = re.compile(r'[#\[="\'\dtf]')
+# Keys that never change the text; their <KeyRelease> is ignored
+_NON_EDIT_KEYS = frozenset((
+    'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next',
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    'Caps_Lock', 'Escape',
+))
+# Longer lines (e.g. pasted blobs) are only highlighted up to this column
+_MAX_SCAN_COLS = 4096
+_TAGS = ('comment', 'table', 'key', 'string', 'number_bool', 'datetime')
+
+@lru_cache(maxsize=4096)
+def _tokenize_line(line):
+    """
+    Returns the (tag, start_col, end_col) spans for one line of TOML.
+    Cached: most lines are identical between highlight passes, and TOML files
+    repeat many lines (e.g. 'north = 0.0'), so the regexes run once per text.
+    """
+    line = line[:_MAX_SCAN_COLS]
+    stripped = line.lstrip()
+    # Comment-only line: no other pattern can apply
+    if stripped.startswith('#'):
+        return (('comment', len(line) - len(stripped), len(line)),)
+
+    spans = []
+    # 1. Table Highlighting (the table tag outranks anything found inside it)
+    if stripped.startswith('[') and _RE_TABLE.match(stripped):
+        spans.append(('table', 0, len(line)))
+
+    # 2. Key Highlighting 
+    key_match = '=' in line and _RE_KEY.match(line)
+    if key_match:
+        spans.append(('key', 0, key_match.end(1)))
+
+    # 3. Inline and Comment Highlighting (nothing after '#' is scanned)
+    for match in _RE_INLINE.finditer(line):
+        spans.append((match.lastgroup, match.start(), match.end()))
+    return tuple(spans)
 
 class TOMLTextEditor(tk.Text):
     """
     A custom Tkinter Text widget that provides basic TOML syntax highlighting.
     """
+    # Tag look shared by every editor: (tag, foreground, font style)
+    _TAG_CONFIGS = (
+        ('comment', 'gray', 'italic'),
+        ('table', '#800080', 'bold'),
+        ('key', '#00008B', 'bold'),
+        ('string', '#8B0000', 'regular'),
+        ('number_bool', '#006400', 'regular'),
+        ('datetime', '#FF8C00', 'regular'),
+    )
+    # Where spans overlap Tk draws the highest tag: keys and tables win over
+    # the value tags found inside them, so no scan has to avoid the overlap
+    _TAG_RAISE = ('comment', 'table', 'key')
+    # Font objects per (Tcl interpreter, family, size), shared by all editors
+    _shared_fonts = {}
+
     def __init__(self, master=None, **kwargs):
         
         self.font_family = kwargs.pop('font_family', TEXT_FONT_FAMILY)
@@ -26,86 +106,185 @@ class TOMLTextEditor(tk.Text):
             'undo': True
         }
         final_kwargs = {**default_kwargs, **kwargs}
+        # Scrolling must also highlight the newly visible lines, so the caller's
+        # yscrollcommand is wrapped by _on_yview (set it here, not via config())
+        self._yscroll_callback = final_kwargs.pop('yscrollcommand', None)
         
-        super().__init__(master, **final_kwargs)
+        super().__init__(master, yscrollcommand=self._on_yview, **final_kwargs)
         
         self._highlight_id = None
+        # Lines edited since the last highlight pass (0 = re-highlight everything)
+        self._dirty_lines = set()
+        self._line_count = 1
+        # Lines whose tags are up to date; only the visible ones are ever highlighted
+        self._highlighted_lines = set()
+        self._visible_id = None
+        # Removes every highlight tag from a range in one Tcl round-trip
+        self._clear_script = 'foreach t {%s} { %s tag remove $t %%s %%s }' % (' '.join(_TAGS), self._w)
         self._configure_tags()
         self.bind('<KeyRelease>', self._on_text_change)
+        self.bind('<Configure>', self._schedule_visible)
         
     def _configure_tags(self):
         """Defines the color and style tags for TOML syntax highlighting."""
-        base_font = (self.font_family, self.font_size)
-        
-        self.tag_config('comment', foreground='gray', font=(self.font_family, self.font_size, 'italic'))
-        self.tag_config('table', foreground='#800080', font=(self.font_family, self.font_size, 'bold')) 
-        self.tag_config('key', foreground='#00008B', font=(self.font_family, self.font_size, 'bold')) 
-        self.tag_config('string', foreground='#8B0000', font=base_font) 
-        self.tag_config('number_bool', foreground='#006400', font=base_font) 
-        self.tag_config('datetime', foreground='#FF8C00', font=base_font)
+        fonts = self._get_fonts()
+        for tag, foreground, style in self._TAG_CONFIGS:
+            self.tag_config(tag, foreground=foreground, font=fonts[style])
+        for tag in self._TAG_RAISE:
+            self.tag_raise(tag)
+
+    def _get_fonts(self):
+        """
+        Regular/bold/italic Font objects, created on first use and then shared by
+        every editor with the same family and size (Tk refers to them by name,
+        instead of parsing a (family, size, style) tuple for every tag).
+        """
+        key = (self.tk, self.font_family, self.font_size)
+        fonts = self._shared_fonts.get(key)
+        if fonts is None:
+            family, size = self.font_family, self.font_size
+            fonts = {
+                'regular': tkfont.Font(root=self, family=family, size=size),
+                'bold': tkfont.Font(root=self, family=family, size=size, weight='bold'),
+                'italic': tkfont.Font(root=self, family=family, size=size, slant='italic'),
+            }
+            self._shared_fonts[key] = fonts
+        return fonts
 
     def _highlight_syntax(self, *args):
-        """Applies syntax highlighting to the current content."""
-        
-        for tag in ['comment', 'table', 'key', 'string', 'number_bool', 'datetime']:
-            self.tag_remove(tag, '1.0', tk.END)
-
-        content = self.get('1.0', tk.END)
-        
-        patterns = {
-            'comment': r'#.*$',                          
-            'table': r'^(\s*\[\[?.*?\]\]?\s*)$',         
-            'string': r'([\'\"])((?:\\.|[^"\\])*)\1',    
-            'number_bool': r'\b(true|false)\b|\b\d+(\.\d*)?([eE][+-]?\d+)?\b', 
-            'key': r'^(\s*[\w\-_"]+)\s*=',               
-            'datetime': r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}([+-]\d{2}:\d{2}|Z)?' 
-        }
-
-        for i, line in enumerate(content.splitlines(), start=1):
-            line_start = f'{i}.0'
-            line_end = f'{i}.{len(line)}'
-            
-            # 1. Table Highlighting 
-            table_match = re.match(patterns['table'], line.strip())
-            if table_match and not line.strip().startswith('#'):
-                self.tag_add('table', line_start, line_end)
-                continue 
-
-            # 2. Key Highlighting 
-            key_match = re.match(patterns['key'], line)
-            if key_match and not line.strip().startswith('#'):
-                key_end_index = key_match.end(1)
-                self.tag_add('key', line_start, f'{i}.{key_end_index}')
-
-            # 3. Inline Highlighting 
-            for tag, pattern in patterns.items():
-                if tag in ['comment', 'table', 'key']:
-                    continue
-                
-                for match in re.finditer(pattern, line):
-                    start_char = match.start(0)
-                    end_char = match.end(0)
-                    self.tag_add(tag, f'{i}.{start_char}', f'{i}.{end_char}')
-
-            # 4. Comment Highlighting 
-            comment_match = re.search(patterns['comment'], line)
-            if comment_match:
-                start_index = comment_match.start(0)
-                self.tag_add('comment', f'{i}.{start_index}', line_end)
+        """
+        Applies syntax highlighting to the current content.  Only the visible
+        lines are tagged now; the rest follow as they are scrolled into view.
+        """
+        self._dirty_lines.clear()
+        self._line_count = self._last_line()
+        self._highlighted_lines.clear()
+        self._highlight_visible()
+
+    def _last_line(self):
+        return int(self.index('end-1c').split('.')[0])
+
+    def _visible_range(self):
+        """First and last line number currently shown in the widget."""
+        first = int(self.index('@0,0').split('.')[0])
+        last = int(self.index(f'@0,{self.winfo_height()}').split('.')[0])
+        return first, last
+
+    def _schedule_visible(self, *args):
+        """Runs _highlight_visible once the widget is idle (many scroll events, one pass)."""
+        if self._visible_id is None:
+            self._visible_id = self.after_idle(self._highlight_visible)
+
+    def _on_yview(self, *args):
+        """yscrollcommand: the view moved, so new lines may need highlighting."""
+        if self._yscroll_callback is not None:
+            self._yscroll_callback(*args)
+        self._schedule_visible()
+
+    def _highlight_visible(self):
+        """Highlights the visible lines (plus HIGHLIGHT_OVERSCAN) not highlighted yet."""
+        self._visible_id = None
+        first, last = self._visible_range()
+        first = max(first - HIGHLIGHT_OVERSCAN, 1)
+        last = min(last + HIGHLIGHT_OVERSCAN, self._last_line())
+        done = self._highlighted_lines
+        line = first
+        while line <= last:
+            if line in done:
+                line += 1
+                continue
+            # One _highlight_lines call per run of consecutive pending lines
+            run_end = line
+            while run_end < last and run_end + 1 not in done:
+                run_end += 1
+            self._highlight_lines(line, run_end)
+            done.update(range(line, run_end + 1))
+            line = run_end + 1
+
+    def _highlight_lines(self, first, last):
+        """Re-applies syntax highlighting to lines first..last (1-based, inclusive) only."""
+        range_start = f'{first}.0'
+        range_end = f'{last}.end'
+        self.tk.eval(self._clear_script % (range_start, range_end))
+
+        # One fetch of just these lines from Tk's line tree; never a copy of the whole buffer
+        lines = self.get(range_start, range_end).split('\n')
+
+        # Index pairs collected per tag, then applied with one Tcl call per tag
+        ranges = {tag: [] for tag in _TAGS}
+
+        for i, line in enumerate(lines, start=first):
+            if not line or not _INTERESTING.search(line):
+                continue
+            for tag, start, end in _tokenize_line(line):
+                ranges[tag] += (f'{i}.{start}', f'{i}.{end}')
+
+        for tag, tag_ranges in ranges.items():
+            if tag_ranges:
+                self.tk.call(self._w, 'tag', 'add', tag, *tag_ranges)
     
     def _on_text_change(self, event):
-        """Handler for text changes, uses a small delay (250ms debounce) before highlighting."""
+        """
+        Handler for text changes: records the edited lines and re-highlights
+        only those once typing pauses (HIGHLIGHT_DELAY_MS debounce).
+        """
+        if event.keysym in _NON_EDIT_KEYS:
+            return
+        # <KeyRelease> also fires for cursor moves and selections; the Tk
+        # modified flag (reset below) tells whether the text really changed
+        if not self.edit_modified():
+            return
+        self.edit_modified(False)
+        if event.state & 0x4:
+            # Control shortcuts (paste, cut, undo/redo) can touch any range
+            self._dirty_lines.add(0)
+        else:
+            cur_line = int(self.index('insert').split('.')[0])
+            # Lines added since the last pass (e.g. Enter) sit just above the cursor
+            added = max(self._last_line() - self._line_count, 0)
+            self._dirty_lines.update(range(max(cur_line - 1 - added, 1), cur_line + 2))
         if self._highlight_id:
             self.after_cancel(self._highlight_id)
-        self._highlight_id = self.after(250, self._highlight_syntax)
+        self._highlight_id = self.after(HIGHLIGHT_DELAY_MS, self._highlight_dirty)
+
+    def _highlight_dirty(self):
+        """Debounce target: re-highlights the lines collected by _on_text_change."""
+        self._highlight_id = None
+        if not self._dirty_lines or 0 in self._dirty_lines:
+            self._highlight_syntax()
+            return
+        last_line = self._last_line()
+        first = min(self._dirty_lines)
+        last = min(max(self._dirty_lines), last_line)
+        self._dirty_lines.clear()
+        if last_line != self._line_count:
+            # Lines below the edit were renumbered; forget them and let
+            # _highlight_visible redo whichever of them are on screen
+            self._highlighted_lines.difference_update(
+                [n for n in self._highlighted_lines if n > first])
+        self._line_count = last_line
+        if first <= last:
+            self._highlight_lines(first, last)
+            self._highlighted_lines.update(range(first, last + 1))
+        self._highlight_visible()
 
     # --- Public Helper Methods ---
 
-    def set_content(self, text):
-        """Sets the content of the editor and triggers highlighting."""
+    def set_content(self, text, undoable=False):
+        """
+        Sets the content of the editor and triggers highlighting.
+        A load is not an edit: unless undoable=True the replace is kept off the
+        undo stack, and the stack is cleared so Undo cannot bring back old text.
+        """
+        if not undoable:
+            self.config(undo=False)
         self.delete('1.0', tk.END)
         self.insert('1.0', text)
+        if not undoable:
+            self.edit_reset()
+            self.config(undo=True)
         self._highlight_syntax()
+        self.edit_modified(False)  # fully highlighted; see _on_text_change
 
     def get_content(self):
         """Gets the content of the editor, stripping trailing whitespace."""
@@ -184,16 +363,42 @@ class TOMLApp(tk.Tk):
         self.text_editor.config(state=tk.DISABLED)
 
     def _load_toml_content(self):
-        """Loads the content of the TOML file into the text editor."""
+        """
+        Loads the content of the TOML file into the text editor.
+        The file is read on a worker thread so a large file does not freeze the
+        window; _poll_loaded_content puts the result into the widget.
+        """
+        self._loaded = None
+        self.edit_button.config(state=tk.DISABLED)  # until the text is in place
+        self.status_label.config(text="Status: Loading...", foreground="blue")
+        worker = threading.Thread(target=self._read_file_worker, daemon=True)
+        worker.start()
+        self.after(15, self._poll_loaded_content, worker)
+
+    def _read_file_worker(self):
+        """Worker thread: slurps the file; no Tk calls are made from here."""
         try:
-            with open(self.toml_filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            self._loaded = Path(self.toml_filepath).read_text(encoding='utf-8')
+        except IOError:
+            self._loaded = None
+
+    def _poll_loaded_content(self, worker):
+        """Tk thread: waits for _read_file_worker, then applies its result."""
+        if worker.is_alive():
+            self.after(15, self._poll_loaded_content, worker)
+            return
+        content, self._loaded = self._loaded, None
+        self._apply_loaded_content(content)
+
+    def _apply_loaded_content(self, content):
+        """Shows the loaded text in the editor (content None = the read failed)."""
+        self.edit_button.config(state=tk.NORMAL)
+        if content is not None:
+            self.status_label.config(text="Status: Read-Only (Click 'Edit TOML' to change)", foreground="blue")
             self.text_editor.config(state=tk.NORMAL)
             self.text_editor.set_content(content)
             self.text_editor.config(state=tk.DISABLED)
-            
-        except IOError:
+        else:
             error_msg = f"Could not read the file: {self.toml_filepath}. Using empty content."
             messagebox.showerror("Load Error", error_msg)
             self.status_label.config(text="Status: Error loading file.", foreground="red")
@@ -213,7 +418,7 @@ class TOMLApp(tk.Tk):
         )
         
         if response:
-            self.text_editor.set_content("")
+            self.text_editor.set_content("", undoable=True)
             self.status_label.config(text="Status: Content cleared. Save or undo changes.", foreground="orange")
 
 
@@ -236,8 +441,7 @@ class TOMLApp(tk.Tk):
 
         content = self.text_editor.get_content()
         try:
-            with open(self.toml_filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self._write_file_atomic(content)
             
             # Revert to read-only state
             self.text_editor.config(state=tk.DISABLED)
@@ -250,10 +454,30 @@ class TOMLApp(tk.Tk):
             # Ensure the content is highlighted correctly after save/read-only switch
             self.text_editor.highlight()
             
-        except IOError as e:
+        except OSError as e:
             messagebox.showerror("Save Error", f"Could not write to file: {e}")
             self.status_label.config(text="Status: ERROR saving file.", foreground="red")
 
+    def _write_file_atomic(self, content):
+        """
+        Writes a sibling temp file, then swaps it in with os.replace: an
+        interrupted save never leaves a half-written TOML behind.  The original
+        file's permission bits are kept; the temp file is removed on failure.
+        """
+        target = os.fspath(self.toml_filepath)
+        tmp_path = target + '.tmp'
+        try:
+            Path(tmp_path).write_text(content, encoding='utf-8')
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
 if __name__ == "__main__":
     # --- Main Application Initialization ---
     INITIAL_FILE = "S10_MAPL1.toml"